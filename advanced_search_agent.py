@@ -1,22 +1,307 @@
 import os
+import logging
+import sys
 import asyncio
+import argparse
+import hashlib
+import functools
 import json
+import gzip
+import time
 from datetime import datetime
 from langchain_openai import ChatOpenAI
-from browser_use import Agent
+from browser_use import Agent, Browser
 from dotenv import load_dotenv
+from cache import ResponseCache, SearchCache, make_key
+from utils import dedupe_keywords, extract_text, search_succeeded, setup_logging, truncate_tokens, write_output
+
+# langdetect is optional; without it every non-English request is transformed
+try:
+    from langdetect import DetectorFactory, LangDetectException, detect
+    DetectorFactory.seed = 0  # Make detection deterministic
+except ImportError:
+    detect = None
+
+# orjson is optional; fall back to the stdlib encoder without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bump whenever the blog transformation prompt changes to invalidate cached articles
+BLOG_PROMPT_VERSION = "2"
+
+# Static instructions for the blog transformation, with everything that varies
+# in the user message. At ~110 tokens this is far below the 1024-token minimum
+# for OpenAI's automatic prompt caching, so it is never served from cache today;
+# keeping it byte-identical (no interpolation) only matters if it grows past that.
+BLOG_SYSTEM_PREFIX = """Transform the research summary provided by the user into a well-written, engaging blog article in the target language they specify.
+
+The article should:
+1. Have an engaging title and introduction
+2. Use a conversational, yet informative tone
+3. Include section headings where appropriate
+4. Maintain all the factual information from the original
+5. Conclude with some thoughtful insights
+6. Be written entirely in the target language"""
+
+# ISO 639-1 codes for output languages, used to detect already-translated results
+_LANGUAGE_CODES = {
+    "english": "en",
+    "chinese": "zh",
+    "spanish": "es",
+    "french": "fr",
+    "german": "de",
+    "italian": "it",
+    "portuguese": "pt",
+    "russian": "ru",
+    "japanese": "ja",
+    "korean": "ko",
+    "arabic": "ar",
+    "hindi": "hi"
+}
+
+# How thoroughly to search at each depth level
+_DEPTH_DESC = {1: "briefly", 2: "thoroughly", 3: "exhaustively"}
+
+# Characters replaced with "_" when building filenames from keywords
+_SAFE_KEYWORD_TABLE = str.maketrans({c: "_" for c in ' /\\:*?"<>|'})
 
 # Load environment variables from .env file
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=8)
+def _get_llm(model, api_key_fp):
+    """
+    Return a shared ChatOpenAI client for a model and API key
+
+    api_key_fp is unused in the body; it only keys the cache so agents with
+    different API keys get separate clients (ChatOpenAI reads the key itself).
+    """
+    return ChatOpenAI(model=model)
+
+def _dump_json(data):
+    """Serialize data to indented UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+def _search_cache_key(task):
+    """Search cache key for a task; its text covers keyword, depth, focus areas and result count"""
+    return make_key("browser_search", task)
+
+def _is_in_language(text, language):
+    """Return True if text appears to already be written in the given language"""
+    code = _LANGUAGE_CODES.get(language.lower())
+    if detect is None or code is None:
+        return False
+    try:
+        # langdetect reports regional variants such as 'zh-cn'
+        return detect(text[:4000]).split("-")[0] == code
+    except LangDetectException:
+        return False
+
 class AdvancedSearchAgent:
-    def __init__(self, openai_api_key=None, model="gpt-4o"):
+    def __init__(self, openai_api_key=None, model="gpt-4o", cache=None, search_cache=None):
         # Use provided API key or get from environment
         if openai_api_key:
             os.environ["OPENAI_API_KEY"] = openai_api_key
         
-        # Initialize the LLM
-        self.llm = ChatOpenAI(model=model)
+        # Initialize the LLM, reusing the client (and its connection pool) across agents
+        self.model = model
+        api_key_fp = hashlib.sha256(os.environ.get("OPENAI_API_KEY", "").encode()).hexdigest()[:16]
+        self.llm = _get_llm(self.model, api_key_fp)
+        
+        # Caches for blog transformations and raw search results, persisted under
+        # ~/.cache/odin by default and only consulted when options["use_cache"] is set
+        self.cache = cache if cache is not None else ResponseCache()
+        self.search_cache = search_cache if search_cache is not None else SearchCache()
+    
+    async def _process_keyword(self, keyword, task, sem, browser, use_cache=False):
+        """
+        Search for a single keyword
+        
+        Args:
+            keyword (str): Keyword or topic to search for
+            task (str): Task description for the browser-use agent
+            sem (asyncio.Semaphore): Limits how many keywords run at once
+            browser (Browser): Shared browser; each agent opens its own context in it
+            use_cache (bool): Store a successful result in the search cache
+        
+        Returns:
+            tuple: The keyword, the raw result text and the search duration
+        """
+        async with sem:
+            # Initialize the browser-use agent
+            agent = Agent(
+                task=task,
+                llm=self.llm,
+                browser=browser,
+            )
+            
+            log.info("Starting deep search for: %s", keyword)
+            log.info("This may take a few minutes depending on search depth...")
+            
+            # Run the agent
+            start_time = time.perf_counter()
+            result = await agent.run()
+            duration = time.perf_counter() - start_time
+            
+            # Convert result to string if it's not already
+            result_text = extract_text(result)
+            
+            # Only reuse runs that actually completed; failed ones should be retried
+            if use_cache and search_succeeded(result):
+                await asyncio.to_thread(self.search_cache.update, _search_cache_key(task), result_text)
+            
+            return keyword, result_text, duration
+    
+    async def _transform_results(self, pending, options):
+        """
+        Transform search results to blog-style articles, batching the LLM calls
+        
+        Args:
+            pending (list): (keyword, result_text, duration) tuples from _process_keyword
+            options (dict): Fully merged options from search_and_summarize
+        
+        Returns:
+            list: Text to save for each entry in pending
+        """
+        texts = [result_text for _, result_text, _ in pending]
+        
+        # Transform to blog-style article in specified language if requested
+        language_str = options["language"].lower()
+        if not options["blog_style"] and language_str == "english":
+            return texts
+        
+        to_transform = []
+        for i, (keyword, result_text, _) in enumerate(pending):
+            # A plain translation is unnecessary if the search already answered in that language
+            if not options["blog_style"] and _is_in_language(result_text, language_str):
+                log.info("Results for '%s' are already in %s, skipping transformation", keyword, options["language"])
+                continue
+            
+            # Bound the cost of the transform call and stay within the context window
+            prompt_text = truncate_tokens(result_text, options["max_transform_tokens"], self.model)
+            
+            # Reuse a previous transformation of the same summary if we have one
+            cache_key = make_key(BLOG_PROMPT_VERSION, language_str, " ".join(prompt_text.split()))
+            if options["use_cache"]:
+                cached_text = await asyncio.to_thread(self.cache.lookup, cache_key, self.model)
+                if cached_text is not None:
+                    log.info("Using cached blog-style article for '%s'", keyword)
+                    texts[i] = cached_text
+                    continue
+            
+            to_transform.append((i, cache_key, prompt_text))
+        
+        if not to_transform:
+            return texts
+        
+        log.info("Transforming %d result(s) to %s blog-style articles...", len(to_transform), options["language"])
+        
+        # Static instructions first, then the per-keyword summary
+        blog_batch = [
+            [
+                ("system", BLOG_SYSTEM_PREFIX),
+                ("human", f"Target language: {language_str}\n\nHere is the research summary to transform:\n\n{prompt_text}"),
+            ]
+            for _, _, prompt_text in to_transform
+        ]
+        
+        # Use the LLM to transform all contents in one batch
+        responses = await self.llm.abatch(
+            blog_batch,
+            config={"max_concurrency": options["max_concurrency"]},
+            return_exceptions=True
+        )
+        
+        for (i, cache_key, _), response in zip(to_transform, responses):
+            if isinstance(response, BaseException):
+                # Keep the untransformed summary rather than losing the search
+                log.warning("Transforming results for '%s' failed, saving them as-is: %s", pending[i][0], response)
+                continue
+            
+            texts[i] = response.content
+            if options["use_cache"]:
+                await asyncio.to_thread(self.cache.update, cache_key, self.model, texts[i])
+        
+        return texts
+    
+    async def _save_summary(self, keyword, file_stem, result_text, duration, options):
+        """
+        Save a finished summary in the requested output format
+        
+        Args:
+            keyword (str): Keyword the summary is about
+            file_stem (str): Filesystem-safe name for the file, unique within the call
+            result_text (str): Summary text to save
+            duration (float): Seconds spent searching
+            options (dict): Fully merged options from search_and_summarize
+        
+        Returns:
+            dict: The output file and search duration
+        """
+        # Capture the time once for the filename and file headers
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        generated_on = now.strftime("%Y-%m-%d %H:%M:%S")
+        
+        # Build the file contents for the requested format
+        if options["output_format"] == "json":
+            output_file = os.path.join(options["output_dir"], f"{file_stem}_{timestamp}.json")
+            json_data = {
+                "keyword": keyword,
+                "timestamp": now.isoformat(),
+                "summary": result_text,
+                "metadata": {
+                    "depth": options["depth"],
+                    "focus_areas": options["focus_areas"],
+                    "duration_seconds": duration,
+                    "language": options["language"],
+                    "blog_style": options["blog_style"]
+                }
+            }
+            content = _dump_json(json_data)
+        else:
+            # Default to markdown
+            ext = "md" if options["output_format"] == "markdown" else "txt"
+            output_file = os.path.join(options["output_dir"], f"{file_stem}_{timestamp}.{ext}")
+            
+            header = ""
+            # For blog-style, the title is likely already in the content
+            if not options["blog_style"]:
+                if options["output_format"] == "markdown":
+                    header = f"# Summary: {keyword}\n\n"
+                    header += f"*Generated on: {generated_on}*\n\n"
+                    if options["focus_areas"]:
+                        header += f"**Focus Areas:** {', '.join(options['focus_areas'])}\n\n"
+                else:
+                    header = f"SUMMARY: {keyword}\n"
+                    header += f"Generated on: {generated_on}\n"
+                    if options["focus_areas"]:
+                        header += f"Focus Areas: {', '.join(options['focus_areas'])}\n\n"
+            
+            content = header + result_text
+        
+        # Gzip in memory so the file is still written with a single async call
+        if options["compress"]:
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            content = gzip.compress(content, compresslevel=6)
+            output_file += ".gz"
+        
+        # Write off the event loop so slow disks don't stall other keywords
+        await write_output(output_file, content)
+        
+        log.info("Summary for '%s' saved to: %s", keyword, output_file)
+        
+        return {
+            "output_file": output_file,
+            "duration_seconds": duration
+        }
     
     async def search_and_summarize(self, keywords, options=None):
         """
@@ -32,6 +317,11 @@ class AdvancedSearchAgent:
                 - focus_areas (list): Specific aspects to focus on
                 - language (str): Output language, default is 'english'
                 - blog_style (bool): Format as blog article, default is False
+                - max_concurrency (int): Keywords to search or transform at once, default is 4
+                - compress (bool): Gzip saved files (adds '.gz'), default is False
+                - max_transform_tokens (int): Token budget for text sent to the blog transform, default is 12000
+                - use_cache (bool): Reuse cached search results (6 hours) and blog transformations (7 days), default is False
+                - raise_on_error (bool): Re-raise a failed search instead of logging and skipping it, default is False
         
         Returns:
             dict: Results including paths to saved files and summary stats
@@ -44,7 +334,12 @@ class AdvancedSearchAgent:
             "max_results": 10,
             "focus_areas": [],
             "language": "english",
-            "blog_style": False
+            "blog_style": False,
+            "max_concurrency": 4,
+            "compress": False,
+            "max_transform_tokens": 12000,
+            "use_cache": False,
+            "raise_on_error": False
         }
         
         # Merge provided options with defaults
@@ -52,191 +347,200 @@ class AdvancedSearchAgent:
             options = {}
         options = {**default_options, **options}
         
+        # A semaphore of 0 would block every keyword forever
+        if options["max_concurrency"] < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {options['max_concurrency']}")
+        
         # Handle single keyword or list of keywords
         if isinstance(keywords, str):
             keywords = [keywords]
         
-        results = {}
+        # Drop blank and repeated keywords so each topic is only searched once
+        unique_keywords = dedupe_keywords(keywords)
+        if len(unique_keywords) < len(keywords):
+            log.info("Dropped %d blank or duplicate keyword(s)", len(keywords) - len(unique_keywords))
+        keywords = unique_keywords
         
-        # Process each keyword
-        for keyword in keywords:
-            # Create a descriptive task for the agent
-            depth_desc = {1: "briefly", 2: "thoroughly", 3: "exhaustively"}
-            depth_level = min(max(options["depth"], 1), 3)  # Ensure depth is between 1-3
-            
-            # Build focus areas string if provided
-            focus_str = ""
-            if options["focus_areas"]:
-                focus_str = f" Focus especially on: {', '.join(options['focus_areas'])}."
-            
-            task = (
-                f"Search {depth_desc[depth_level]} for information about '{keyword}'."
-                f" Find detailed facts, comparisons, and recent developments."
-                f" Create a comprehensive summary with key points organized by subtopics."
-                f" Include up to {options['max_results']} most relevant findings.{focus_str}"
-            )
-            
-            # Initialize the browser-use agent
-            agent = Agent(
-                task=task,
-                llm=self.llm,
+        # Build the parts of the task that are the same for every keyword
+        depth_level = min(max(options["depth"], 1), 3)  # Ensure depth is between 1-3
+        depth_word = _DEPTH_DESC[depth_level]
+        
+        # Build focus areas string if provided
+        focus_str = ""
+        if options["focus_areas"]:
+            focus_str = f" Focus especially on: {', '.join(options['focus_areas'])}."
+        
+        task_details = (
+            f" Find detailed facts, comparisons, and recent developments."
+            f" Create a comprehensive summary with key points organized by subtopics."
+            f" Include up to {options['max_results']} most relevant findings.{focus_str}"
+        )
+        
+        tasks = [f"Search {depth_word} for information about '{keyword}'.{task_details}" for keyword in keywords]
+        
+        # Serve cache hits first so the browser is only launched for the misses
+        searches = {}
+        if options["use_cache"]:
+            cached_texts = await asyncio.gather(
+                *[asyncio.to_thread(self.search_cache.lookup, _search_cache_key(task)) for task in tasks]
             )
+            for keyword, cached_text in zip(keywords, cached_texts):
+                if cached_text is not None:
+                    log.info("Using cached search results for '%s'", keyword)
+                    searches[keyword] = (keyword, cached_text, 0.0)
+        
+        misses = [(keyword, task) for keyword, task in zip(keywords, tasks) if keyword not in searches]
+        if misses:
+            # Search the remaining keywords concurrently, bounded by max_concurrency. A
+            # single browser is launched up front and each search gets a lightweight context
+            sem = asyncio.Semaphore(options["max_concurrency"])
+            browser = Browser()
+            try:
+                # Launch Playwright now; browser-use starts it lazily on first use, and
+                # concurrent agents racing to do so would each launch their own Chromium
+                await browser.get_playwright_browser()
+                outcomes = await asyncio.gather(
+                    *[
+                        self._process_keyword(keyword, task, sem, browser, use_cache=options["use_cache"])
+                        for keyword, task in misses
+                    ],
+                    return_exceptions=True
+                )
+            finally:
+                await browser.close()
             
-            print(f"Starting deep search for: {keyword}")
-            print(f"This may take a few minutes depending on search depth...")
-            
-            # Run the agent
-            start_time = datetime.now()
-            result = await agent.run()
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
-            
-            # Convert result to string if it's not already
-            if hasattr(result, 'text'):
-                result_text = result.text
-            elif hasattr(result, '__str__'):
-                result_text = str(result)
-            else:
-                # If we can't convert it directly, extract the last message
-                try:
-                    if hasattr(result, 'messages') and result.messages:
-                        result_text = result.messages[-1].content
-                    else:
-                        result_text = "Could not extract text from search results."
-                except:
-                    result_text = "Could not extract text from search results."
-            
-            # Transform to blog-style article in specified language if requested
-            if options["blog_style"] or options["language"].lower() != "english":
-                print(f"Transforming results to {options['language']} blog-style article...")
-                
-                # Create a prompt for the transformation
-                language_str = options["language"].lower()
-                blog_prompt = f"""
-                Transform the following research summary into a well-written, engaging {language_str} blog article.
-                
-                The article should:
-                1. Have an engaging title and introduction
-                2. Use a conversational, yet informative tone
-                3. Include section headings where appropriate
-                4. Maintain all the factual information from the original
-                5. Conclude with some thoughtful insights
-                6. Be written entirely in {language_str}
-                
-                Here is the research summary to transform:
-                
-                {result_text}
-                """
-                
-                # Use the LLM to transform the content
-                blog_response = self.llm.invoke(blog_prompt)
-                result_text = blog_response.content
-            
-            # Ensure output directory exists
-            os.makedirs(options["output_dir"], exist_ok=True)
-            
-            # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_keyword = keyword.replace(" ", "_").replace("/", "_").replace("\\", "_")
-            
-            # Save the summary based on the requested format
-            if options["output_format"] == "json":
-                output_file = os.path.join(options["output_dir"], f"{safe_keyword}_{timestamp}.json")
-                with open(output_file, "w", encoding="utf-8") as f:
-                    json_data = {
-                        "keyword": keyword,
-                        "timestamp": datetime.now().isoformat(),
-                        "summary": result_text,
-                        "metadata": {
-                            "depth": options["depth"],
-                            "focus_areas": options["focus_areas"],
-                            "duration_seconds": duration,
-                            "language": options["language"],
-                            "blog_style": options["blog_style"]
-                        }
-                    }
-                    json.dump(json_data, f, indent=2, ensure_ascii=False)
-            else:
-                # Default to markdown
-                ext = "md" if options["output_format"] == "markdown" else "txt"
-                output_file = os.path.join(options["output_dir"], f"{safe_keyword}_{timestamp}.{ext}")
-                
-                with open(output_file, "w", encoding="utf-8") as f:
-                    if options["output_format"] == "markdown":
-                        # For blog-style, the title is likely already in the content
-                        if not options["blog_style"]:
-                            f.write(f"# Summary: {keyword}\n\n")
-                            f.write(f"*Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
-                            if options["focus_areas"]:
-                                f.write(f"**Focus Areas:** {', '.join(options['focus_areas'])}\n\n")
-                    else:
-                        if not options["blog_style"]:
-                            f.write(f"SUMMARY: {keyword}\n")
-                            f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                            if options["focus_areas"]:
-                                f.write(f"Focus Areas: {', '.join(options['focus_areas'])}\n\n")
-                    
-                    f.write(result_text)
-            
-            print(f"Summary for '{keyword}' saved to: {output_file}")
-            
-            # Store results
-            results[keyword] = {
-                "output_file": output_file,
-                "duration_seconds": duration
-            }
+            for (keyword, _), outcome in zip(misses, outcomes):
+                searches[keyword] = outcome
+        
+        pending = []
+        for keyword in keywords:
+            search = searches[keyword]
+            if isinstance(search, BaseException):
+                if options["raise_on_error"]:
+                    raise search
+                log.warning("Search for '%s' failed: %s", keyword, search)
+                continue
+            pending.append(search)
+        
+        # Transform all results together so the LLM calls are batched
+        texts = await self._transform_results(pending, options)
+        
+        # Ensure output directory exists
+        os.makedirs(options["output_dir"], exist_ok=True)
+        
+        # All files are written in the same second, so distinct keywords that
+        # sanitize to the same name (e.g. "a b" and "a/b") get a numeric suffix
+        file_stems = []
+        used_stems = set()
+        for keyword, _, _ in pending:
+            base_stem = keyword.translate(_SAFE_KEYWORD_TABLE)
+            file_stem, n = base_stem, 1
+            # Compare case-insensitively for case-insensitive filesystems
+            while file_stem.lower() in used_stems:
+                n += 1
+                file_stem = f"{base_stem}_{n}"
+            used_stems.add(file_stem.lower())
+            file_stems.append(file_stem)
+        
+        saved = await asyncio.gather(
+            *[
+                self._save_summary(keyword, file_stem, text, duration, options)
+                for (keyword, _, duration), file_stem, text in zip(pending, file_stems, texts)
+            ]
+        )
+        results = {keyword: data for (keyword, _, _), data in zip(pending, saved)}
         
         return results
 
-async def main():
-    # Create the agent
-    agent = AdvancedSearchAgent()
-    
-    # Get user input
+def _positive_int(value):
+    """argparse type for integers of at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+def _build_parser():
+    """Build the command-line parser for the advanced search agent"""
+    parser = argparse.ArgumentParser(description="Search the web for keywords and save summaries")
+    parser.add_argument("--keywords", help="Keywords or topics to search (comma-separated); prompts interactively if omitted")
+    parser.add_argument("--depth", type=int, default=2, choices=[1, 2, 3], help="Search depth, where 3 is deepest (default: 2)")
+    parser.add_argument("--focus", default="", help="Specific focus areas (comma-separated)")
+    parser.add_argument("--format", choices=["markdown", "json", "txt"], default="markdown", help="Output format (default: markdown)")
+    parser.add_argument("--language", default="english", help="Output language (default: english)")
+    parser.add_argument("--blog", action="store_true", help="Format results as blog articles")
+    parser.add_argument("--output-dir", default="search_results", help="Directory to save results (default: search_results)")
+    parser.add_argument("--max-concurrency", type=_positive_int, default=4, help="Keywords to search at once (default: 4)")
+    parser.add_argument("--compress", action="store_true", help="Gzip saved files to save disk space")
+    parser.add_argument("--use-cache", action="store_true", help="Reuse cached search results and blog transformations")
+    return parser
+
+def _prompt_interactive(args):
+    """Fill in the search settings on args from terminal prompts"""
     print("Advanced Search Agent")
     print("====================")
     
     # Get keywords
-    keywords_input = input("Enter keywords or topics to search (comma-separated): ")
-    keywords = [k.strip() for k in keywords_input.split(",")]
+    args.keywords = input("Enter keywords or topics to search (comma-separated): ")
     
     # Get search depth
-    depth = int(input("Enter search depth (1-3, where 3 is deepest): "))
+    args.depth = int(input("Enter search depth (1-3, where 3 is deepest): "))
     
     # Get focus areas (optional)
-    focus_input = input("Enter specific focus areas (comma-separated, or press Enter to skip): ")
-    focus_areas = [f.strip() for f in focus_input.split(",")] if focus_input.strip() else []
+    args.focus = input("Enter specific focus areas (comma-separated, or press Enter to skip): ")
     
     # Get output format
     format_options = ["markdown", "json", "txt"]
     format_input = input(f"Enter output format ({'/'.join(format_options)}, default: markdown): ")
-    output_format = format_input.lower() if format_input.lower() in format_options else "markdown"
+    args.format = format_input.lower() if format_input.lower() in format_options else "markdown"
     
     # Get language preference
     language_input = input("Enter output language (e.g., english, chinese, default: english): ")
-    language = language_input.strip() if language_input.strip() else "english"
+    args.language = language_input.strip() if language_input.strip() else "english"
     
     # Get blog style preference
     blog_style_input = input("Format as blog article? (y/n, default: n): ")
-    blog_style = blog_style_input.lower() in ["y", "yes", "true"]
+    args.blog = blog_style_input.lower() in ["y", "yes", "true"]
+
+async def main():
+    parser = _build_parser()
+    args = parser.parse_args()
+    
+    # Without --keywords, fall back to prompting when a user is at the terminal
+    if args.keywords is None:
+        if not sys.stdin.isatty():
+            parser.error("--keywords is required when not running interactively")
+        _prompt_interactive(args)
+    
+    keywords = dedupe_keywords(args.keywords.split(","))
+    focus_areas = [f.strip() for f in args.focus.split(",")] if args.focus.strip() else []
     
     # Configure options
     options = {
-        "depth": depth,
-        "output_format": output_format,
+        "depth": args.depth,
+        "output_format": args.format,
         "focus_areas": focus_areas,
-        "output_dir": "search_results",
-        "language": language,
-        "blog_style": blog_style
+        "output_dir": args.output_dir,
+        "language": args.language,
+        "blog_style": args.blog,
+        "max_concurrency": args.max_concurrency,
+        "compress": args.compress,
+        "use_cache": args.use_cache
     }
     
-    # Run the search
-    results = await agent.search_and_summarize(keywords, options)
-    
-    # Print summary
-    print("\nSearch completed!")
-    for keyword, data in results.items():
-        print(f"- '{keyword}': Saved to {data['output_file']} (took {data['duration_seconds']:.1f} seconds)")
+    listener = setup_logging()
+    try:
+        # Create the agent
+        agent = AdvancedSearchAgent()
+        
+        # Run the search
+        results = await agent.search_and_summarize(keywords, options)
+        
+        # Print summary; this is the program's result, so it goes to stdout
+        print("\nSearch completed!")
+        for keyword, data in results.items():
+            print(f"- '{keyword}': Saved to {data['output_file']} (took {data['duration_seconds']:.1f} seconds)")
+    finally:
+        listener.stop()
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,150 @@
+import os
+import time
+import zlib
+import hashlib
+import sqlite3
+import threading
+
+# zstandard is optional; without it cached search results are compressed with zlib
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Default location for persistent caches
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "odin")
+
+# Every zstd frame starts with this magic number, which tells the two codecs apart
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def make_key(*parts):
+    """
+    Build a stable cache key from the given parts
+
+    Args:
+        *parts: Values that identify the cached entry (must have a stable repr)
+
+    Returns:
+        str: Hex digest usable as a cache key
+    """
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+def _compress(text):
+    data = text.encode("utf-8")
+    if zstandard is not None:
+        return zstandard.ZstdCompressor().compress(data)
+    return zlib.compress(data)
+
+
+def _decompress(blob):
+    # Returns None for zstd entries when zstandard is no longer installed
+    if blob.startswith(_ZSTD_MAGIC):
+        if zstandard is None:
+            return None
+        return zstandard.ZstdDecompressor().decompress(blob).decode("utf-8")
+    return zlib.decompress(blob).decode("utf-8")
+
+
+class _SQLiteStore:
+    """Lazily opened SQLite database holding a single cache table"""
+
+    # CREATE TABLE statement for the cache table, set by subclasses
+    _schema = None
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = None
+        # Callers run lookups in worker threads (asyncio.to_thread), so the
+        # connection is shared across threads and access is serialized here
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        # Open the database lazily so creating an agent never touches disk.
+        # Must be called with self._lock held
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(self._schema)
+        return self._conn
+
+
+class ResponseCache(_SQLiteStore):
+    """
+    SQLite-backed LLM response cache, modelled on langchain_core.caches.BaseCache
+
+    Entries are looked up by (key, llm_string) so responses from different
+    models never mix, and expire after a TTL.
+    """
+
+    _schema = (
+        "CREATE TABLE IF NOT EXISTS responses ("
+        " key TEXT NOT NULL,"
+        " llm_string TEXT NOT NULL,"
+        " response TEXT NOT NULL,"
+        " created_at INTEGER NOT NULL,"
+        " PRIMARY KEY (key, llm_string))"
+    )
+
+    def __init__(self, path=None, ttl=7 * 24 * 60 * 60):
+        super().__init__(path or os.path.join(CACHE_DIR, "responses.db"))
+        self.ttl = ttl
+
+    def lookup(self, key, llm_string):
+        """Return the cached response, or None if missing or older than the TTL"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT response FROM responses WHERE key = ? AND llm_string = ? AND created_at > ?",
+                (key, llm_string, int(time.time()) - self.ttl),
+            ).fetchone()
+        return row[0] if row else None
+
+    def update(self, key, llm_string, response):
+        """Store a response in the cache, evicting expired entries"""
+        now = int(time.time())
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM responses WHERE created_at <= ?", (now - self.ttl,))
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, llm_string, response, now),
+            )
+
+
+class SearchCache(_SQLiteStore):
+    """
+    SQLite-backed cache of raw browser search results that expire after a TTL
+
+    Result text is stored compressed (zstandard if installed, zlib otherwise).
+    """
+
+    _schema = (
+        "CREATE TABLE IF NOT EXISTS searches ("
+        " key TEXT PRIMARY KEY,"
+        " result_text BLOB NOT NULL,"
+        " created_at INTEGER NOT NULL)"
+    )
+
+    def __init__(self, path=None, ttl=6 * 60 * 60):
+        super().__init__(path or os.path.join(CACHE_DIR, "searches.db"))
+        self.ttl = ttl
+
+    def lookup(self, key):
+        """Return the cached result text, or None if missing or older than the TTL"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT result_text FROM searches WHERE key = ? AND created_at > ?",
+                (key, int(time.time()) - self.ttl),
+            ).fetchone()
+        return _decompress(row[0]) if row else None
+
+    def update(self, key, result_text):
+        """Store a search result in the cache, evicting expired entries"""
+        blob = _compress(result_text)
+        now = int(time.time())
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM searches WHERE created_at <= ?", (now - self.ttl,))
+            conn.execute(
+                "INSERT OR REPLACE INTO searches VALUES (?, ?, ?)",
+                (key, blob, now),
+            )
@@ -0,0 +1,156 @@
+import queue
+import logging
+import functools
+from logging.handlers import QueueHandler, QueueListener
+
+import aiofiles
+import tiktoken
+
+def _find_text(result):
+    # Return the text a result carries explicitly, or None if there is none
+    final_result = getattr(result, "final_result", None)
+    if callable(final_result):
+        text = final_result()
+        if text:
+            return text
+    
+    # Attribute access is tried directly rather than probed with hasattr,
+    # which would look each attribute up twice
+    try:
+        return result.text
+    except AttributeError:
+        pass
+    
+    # Fall back to the last message of the conversation if there is one
+    messages = getattr(result, "messages", None)
+    if messages:
+        return messages[-1].content
+    
+    return None
+
+def extract_text(result):
+    """
+    Extract readable text from a browser-use agent result
+    
+    Args:
+        result: Value returned by Agent.run()
+    
+    Returns:
+        str: The result text
+    """
+    text = _find_text(result)
+    return text if text is not None else str(result)
+
+def search_succeeded(result):
+    """
+    Check whether a browser-use agent run finished its task with a usable answer
+    
+    Runs that hit the step limit or ended in an error still return a history,
+    which extract_text can only render with str(); those must not be reused.
+    
+    Args:
+        result: Value returned by Agent.run()
+    
+    Returns:
+        bool: True if the run is done, did not report failure and carries text
+    """
+    is_done = getattr(result, "is_done", None)
+    if not callable(is_done) or not is_done():
+        return False
+    
+    # is_successful only exists in later 0.1.x releases; None means unknown
+    is_successful = getattr(result, "is_successful", None)
+    if callable(is_successful) and is_successful() is False:
+        return False
+    
+    return _find_text(result) is not None
+
+def dedupe_keywords(keywords):
+    """
+    Strip keywords and drop blanks and case-insensitive duplicates
+    
+    Args:
+        keywords (iterable): Keywords as entered by the user
+    
+    Returns:
+        list: Unique keywords in their original order
+    """
+    seen = set()
+    unique = []
+    for keyword in keywords:
+        keyword = keyword.strip()
+        if keyword and keyword.lower() not in seen:
+            seen.add(keyword.lower())
+            unique.append(keyword)
+    return unique
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(model):
+    # Loading an encoding takes ~100ms, so do it once per model
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+def truncate_tokens(text, max_tokens, model="gpt-4o"):
+    """
+    Truncate text to a token budget for the given model
+    
+    Args:
+        text (str): Text to truncate
+        max_tokens (int): Maximum number of tokens to keep
+        model (str): Model whose tokenizer is used to count tokens
+    
+    Returns:
+        str: The text, cut at max_tokens and marked '[truncated]' if it was longer
+    """
+    encoding = _get_encoding(model)
+    # Scraped pages may contain special-token text such as <|endoftext|>; count it as plain text
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens]) + "\n\n[truncated]"
+
+def setup_logging(level=logging.INFO):
+    """
+    Configure logging for the command-line agents
+    
+    Records are handed to a queue and written to stderr by a background
+    thread, so logging from the event loop never waits on the terminal.
+    
+    Args:
+        level (int): Minimum level to log
+    
+    Returns:
+        QueueListener: The running listener; call stop() before exiting to flush it
+    """
+    log_queue = queue.SimpleQueue()
+    # QueueHandler formats records before queueing them, so the format lives there
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    listener = QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(level=level, handlers=[queue_handler], force=True)
+    
+    # browser-use attaches its own stdout handler to its logger and stops it
+    # propagating; send its records through the queue too so they go to stderr
+    browser_use_log = logging.getLogger("browser_use")
+    for handler in browser_use_log.handlers[:]:
+        browser_use_log.removeHandler(handler)
+    browser_use_log.propagate = True
+    listener.start()
+    return listener
+
+async def write_output(output_file, content):
+    """
+    Write a finished summary to disk without blocking the event loop
+    
+    Args:
+        output_file (str): Path to write to
+        content (str or bytes): Full file contents, written in a single call
+    """
+    if isinstance(content, bytes):
+        async with aiofiles.open(output_file, "wb") as f:
+            await f.write(content)
+    else:
+        async with aiofiles.open(output_file, "w", encoding="utf-8") as f:
+            await f.write(content)